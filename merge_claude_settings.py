@@ -7,92 +7,413 @@ extracts their "allow" permissions lists, merges them, and writes the result
 to a new settings.local.json file.
 """
 
+import contextlib
+import functools
 import json
 import os
+import queue
+import re
+import stat
 import sys
+import threading
+import uuid
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Set, List, Dict, Any
+from typing import Set, List, Dict, Any, BinaryIO, Iterator, Optional, TextIO, Tuple
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def find_settings_files(root_dir: Path) -> List[Path]:
+# Repository clutter that never holds project settings, so it is never descended into
+_EXCLUDE_DIRS = frozenset(
+    {
+        ".git",
+        "node_modules",
+        "__pycache__",
+        "venv",
+        ".venv",
+        "target",
+        "build",
+        "dist",
+    }
+)
+
+_SETTINGS_FILE_NAME = "settings.local.json"
+
+# Matches a trailing comma before a closing bracket or brace
+_TRAILING_COMMA_RE = re.compile(rb",\s*([}\]])")
+
+# Number of threads used to read settings files concurrently
+_MAX_READ_WORKERS = 16
+
+_READ_CHUNK_SIZE = 1 << 16
+
+# Number of permissions encoded per write when streaming permissions.allow
+_ALLOW_SLICE_SIZE = 1024
+
+# JSON parser for settings files, resolved once at import time. Both accept
+# bytes, and json.loads already reuses the stdlib's shared decoder instance.
+_load_json = orjson.loads if orjson is not None else json.loads
+
+
+def _read_bytes(file_path: Path) -> bytes:
+    """Read a whole file with os.read, bypassing Python's buffered file objects."""
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        # Size the first read from fstat so it usually returns the whole file,
+        # but only an empty read means EOF: reads can come back short on
+        # network/FUSE filesystems and for very large files
+        chunks = [os.read(fd, os.fstat(fd).st_size or _READ_CHUNK_SIZE)]
+        while chunks[-1]:
+            chunks.append(os.read(fd, _READ_CHUNK_SIZE))
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+@contextlib.contextmanager
+def _atomic_writer(file_path: Path) -> Iterator[BinaryIO]:
+    """Open a temporary sibling file that atomically replaces file_path on success."""
+    tmp_path = os.path.join(file_path.parent, f".settings-{uuid.uuid4().hex}.tmp")
+    # Create it the way open() would, so a new file gets the umask-derived mode
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            # Keep the mode of the file we replace
+            try:
+                mode = os.stat(file_path).st_mode
+            except FileNotFoundError:
+                pass
+            else:
+                os.fchmod(f.fileno(), stat.S_IMODE(mode))
+
+            yield f
+
+            # Make the data durable before the rename makes it visible
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _dump_json(obj: Any) -> bytes:
     """
-    Find all .claude/settings.local.json files in the given directory tree.
-    Uses glob pattern for recursive search.
+    Serialize a value to 2-space indented UTF-8 JSON.
+
+    Meant for strings and lists of strings, where orjson and the stdlib produce
+    identical bytes. orjson would write NaN and Infinity as null and float
+    exponents without a "+", so arbitrary settings values go through
+    _dump_json_exact instead. Values orjson cannot encode are serialized with
+    the stdlib.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _dump_json_exact(obj: Any) -> bytes:
+    """Serialize a value to 2-space indented UTF-8 JSON exactly like the stdlib."""
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _stream_settings(
+    f: BinaryIO, settings: Dict[str, Any], allow_sorted: List[str]
+) -> None:
+    """
+    Write settings as 2-space indented JSON, streaming permissions.allow.
+
+    The output matches serializing the whole document at once with the stdlib,
+    but the allow list is encoded in slices so its full encoded form is never
+    held in memory. Only the permission strings and keys use _dump_json.
 
     Args:
-        root_dir: Root directory to search in
+        f: Binary file to write to
+        settings: Settings to write, including a "permissions" dict
+        allow_sorted: Sorted permissions written as permissions.allow
+    """
+
+    def write_value(value: Any, indent: bytes) -> None:
+        # Nested values are serialized on their own, so shift their lines over.
+        # They are written back into the user's file, so keep them exact.
+        f.write(_dump_json_exact(value).replace(b"\n", b"\n" + indent))
+
+    f.write(b"{")
+    for i, (key, value) in enumerate(settings.items()):
+        f.write(b",\n  " if i else b"\n  ")
+        f.write(_dump_json(key) + b": ")
+        if key != "permissions":
+            write_value(value, b"  ")
+            continue
+
+        f.write(b"{")
+        for j, (perm_key, perm_value) in enumerate(value.items()):
+            f.write(b",\n    " if j else b"\n    ")
+            f.write(_dump_json(perm_key) + b": ")
+            if perm_key != "allow":
+                write_value(perm_value, b"    ")
+            elif not allow_sorted:
+                f.write(b"[]")
+            else:
+                f.write(b"[\n")
+                for start in range(0, len(allow_sorted), _ALLOW_SLICE_SIZE):
+                    if start:
+                        f.write(b",\n")
+                    # Encode a slice as its own array and keep only its items,
+                    # shifted right to the depth of permissions.allow
+                    chunk = _dump_json(allow_sorted[start : start + _ALLOW_SLICE_SIZE])
+                    f.write(b"    " + chunk[2:-2].replace(b"\n", b"\n    "))
+                f.write(b"\n    ]")
+        f.write(b"\n  }")
+    f.write(b"\n}\n")
+
+
+def _scan_directory(directory: str) -> Tuple[List[str], List[str]]:
+    """
+    Scan a single directory for a .claude/settings.local.json file.
+
+    Args:
+        directory: Directory to scan
 
     Returns:
-        List of Path objects for found settings files
+        Tuple of (found settings file paths, subdirectories to descend into)
     """
-    # Use glob pattern to recursively find all settings.local.json files
-    # **/.claude/settings.local.json will match at any depth
-    settings_files = list(root_dir.glob("**/.claude/settings.local.json"))
+    found = []
+    subdirs = []
 
-    # Sort for consistent output
-    settings_files.sort()
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name == ".claude":
+                    # The rest of the pattern is literal, so probe for the
+                    # file directly instead of scanning .claude itself
+                    candidate = os.path.join(entry.path, _SETTINGS_FILE_NAME)
+                    if os.path.isfile(candidate):
+                        found.append(candidate)
+                # is_dir() uses the cached dirent type, no extra stat needed
+                elif entry.name not in _EXCLUDE_DIRS and entry.is_dir(
+                    follow_symlinks=False
+                ):
+                    subdirs.append(entry.path)
+    except OSError:
+        # Unreadable directories are skipped, like glob does
+        pass
+
+    return found, subdirs
+
+
+def _scan_tree_concurrently(
+    root: str, max_depth: Optional[int], workers: int
+) -> List[str]:
+    """
+    Walk a directory tree with a fixed pool of threads draining a shared queue.
+
+    Args:
+        root: Root directory to search in
+        max_depth: Maximum depth of directories to scan below root
+            (None for unlimited)
+        workers: Number of scanning threads
+
+    Returns:
+        Unsorted list of found settings file paths
+    """
+    settings_files = []
+    lock = threading.Lock()
+    # Directories still to scan, with their depth below root; None stops a worker
+    directories = queue.Queue()
+
+    def worker() -> None:
+        while True:
+            item = directories.get()
+            if item is None:
+                return
+            directory, depth = item
+            try:
+                found, subdirs = _scan_directory(directory)
+                if found:
+                    with lock:
+                        settings_files.extend(found)
+                # Queue children before task_done() so join() cannot return early
+                if max_depth is None or depth < max_depth:
+                    for subdir in subdirs:
+                        directories.put((subdir, depth + 1))
+            finally:
+                directories.task_done()
+
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+
+    directories.put((root, 0))
+    directories.join()
+
+    for _ in threads:
+        directories.put(None)
+    for thread in threads:
+        thread.join()
 
     return settings_files
 
 
-def extract_allow_permissions(file_path: Path) -> Set[str]:
+def find_settings_files(
+    root_dir: Path, max_depth: Optional[int] = None, scan_workers: int = 0
+) -> List[Path]:
     """
-    Extract the "allow" permissions list from a settings.local.json file.
+    Find all .claude/settings.local.json files in the given directory tree.
+    Walks the tree with os.scandir and only probes directories whose listing
+    contains a .claude entry.
+
+    Args:
+        root_dir: Root directory to search in
+        max_depth: Maximum depth of directories to scan below root_dir
+            (None for unlimited)
+        scan_workers: Number of threads scanning directories concurrently,
+            or 0 to walk the tree sequentially
+
+    Returns:
+        List of Path objects for found settings files
+    """
+    if scan_workers:
+        # Worth it on network filesystems, where every listing is a round-trip
+        # that scandir waits on with the GIL released
+        settings_files = _scan_tree_concurrently(str(root_dir), max_depth, scan_workers)
+    else:
+        # On local disks the listing is served from the page cache, and thread
+        # handoff costs about as much as it overlaps, so walk sequentially
+        settings_files = []
+        # Directories still to scan, with their depth below root_dir
+        stack = [(str(root_dir), 0)]
+        while stack:
+            directory, depth = stack.pop()
+            found, subdirs = _scan_directory(directory)
+            settings_files.extend(found)
+            if max_depth is None or depth < max_depth:
+                stack.extend((subdir, depth + 1) for subdir in subdirs)
+
+    # Sort for consistent output, by path components like Path ordering does
+    settings_files.sort(key=lambda path: path.split(os.sep))
+
+    # Only the final results become Path objects
+    return [Path(path) for path in settings_files]
+
+
+def _read_allow_permissions(file_path: Path) -> Tuple[Set[str], Optional[str]]:
+    """
+    Read the "allow" permissions list from a settings.local.json file.
 
     Args:
         file_path: Path to the settings.local.json file
 
     Returns:
-        Set of allowed permission strings
+        Tuple of (set of allowed permission strings, warning message or None)
     """
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _load_json(_read_bytes(file_path))
 
-        permissions = data.get("permissions", {})
-        allow_list = permissions.get("allow", [])
+        # Direct lookups are cheapest when the keys exist, which is the common case.
+        # Wrong types raise TypeError and are reported below like other errors.
+        try:
+            allow_list = data["permissions"]["allow"]
+        except KeyError:
+            allow_list = ()
 
-        return set(allow_list)
+        # Permissions repeat heavily across projects; interning shares one
+        # object per distinct string and skips malformed non-string entries
+        return {sys.intern(perm) for perm in allow_list if isinstance(perm, str)}, None
 
     except json.JSONDecodeError as e:
-        print(f"⚠️  Error parsing JSON in {file_path}: {e}", file=sys.stderr)
-        return set()
+        return set(), f"⚠️  Error parsing JSON in {file_path}: {e}"
     except Exception as e:
-        print(f"⚠️  Error reading {file_path}: {e}", file=sys.stderr)
-        return set()
+        return set(), f"⚠️  Error reading {file_path}: {e}"
 
 
-def merge_permissions(settings_files: List[Path], root_dir: Path) -> Set[str]:
+def extract_allow_permissions(file_path: Path) -> Set[str]:
+    """
+    Extract the "allow" permissions list from a settings.local.json file.
+
+    Args:
+        file_path: Path to the settings.local.json file
+
+    Returns:
+        Set of allowed permission strings
+    """
+    permissions, warning = _read_allow_permissions(file_path)
+    if warning is not None:
+        print(warning, file=sys.stderr)
+    return permissions
+
+
+def merge_permissions(
+    settings_files: List[Path], root_dir: Path, out: Optional[TextIO] = None
+) -> Set[str]:
     """
     Merge all allow permissions from multiple settings files.
 
     Args:
         settings_files: List of settings file paths
         root_dir: Root directory for relative path display
+        out: Stream for the report (defaults to sys.stdout)
 
     Returns:
         Set of all unique allowed permissions
     """
+    if out is None:
+        out = sys.stdout
+
     all_permissions = set()
+    messages = []
+
+    # Reads are I/O bound, so overlap them (e.g. on network filesystems);
+    # map() keeps results in input order, and warnings are printed here rather
+    # than from the workers so the report stays deterministic
+    with ThreadPoolExecutor(max_workers=_MAX_READ_WORKERS) as executor:
+        results = list(executor.map(_read_allow_permissions, settings_files))
+
+    # Plain string prefix check instead of building Path objects per file
+    root_prefix = os.path.join(os.fspath(root_dir), "")
+
+    for file_path, (permissions, warning) in zip(settings_files, results):
+        if warning is not None:
+            # Emit the report so far first, so the warning shows up in file order
+            if messages:
+                out.write("\n".join(messages) + "\n")
+                out.flush()
+                messages.clear()
+            print(warning, file=sys.stderr)
 
-    for file_path in settings_files:
-        permissions = extract_allow_permissions(file_path)
         if permissions:
             # Try to show relative path from root_dir, otherwise show absolute path
-            try:
-                display_path = file_path.relative_to(root_dir)
-            except ValueError:
-                # If file is not under root_dir, show absolute path
-                display_path = file_path
+            display_path = os.fspath(file_path)
+            if display_path.startswith(root_prefix):
+                display_path = display_path[len(root_prefix) :]
 
-            print(f"  📄 Found {len(permissions)} permissions in: {display_path}")
+            messages.append(
+                f"  📄 Found {len(permissions)} permissions in: {display_path}"
+            )
             all_permissions.update(permissions)
 
+    # Report all files with a single write instead of one print per file
+    if messages:
+        out.write("\n".join(messages) + "\n")
+
     return all_permissions
 
 
-def update_settings_file(output_path: Path, permissions: Set[str]) -> None:
+def update_settings_file(
+    output_path: Path, permissions: Set[str], out: Optional[TextIO] = None
+) -> None:
     """
     Update the settings.json file with merged permissions.
     Preserves existing configuration and merges with existing permissions.allow field.
@@ -100,32 +421,37 @@ def update_settings_file(output_path: Path, permissions: Set[str]) -> None:
     Args:
         output_path: Path where to write the output file
         permissions: Set of allowed permissions to add
+        out: Stream for progress messages (defaults to sys.stdout)
     """
+    if out is None:
+        out = sys.stdout
+
     try:
         # Check if the file exists and read existing content
         existing_settings = {}
         existing_allow = set()
+        fixed_formatting = False
 
-        if output_path.exists():
+        if os.path.isfile(output_path):
             try:
-                with open(output_path, "r", encoding="utf-8") as f:
-                    content = f.read()
+                content = _read_bytes(output_path)
 
-                # Try to parse JSON directly first
+                # Try to parse JSON directly first. This file is written back, so
+                # use the stdlib parser: orjson turns integers beyond 64 bits
+                # into floats, which would silently change the user's settings
                 try:
                     existing_settings = json.loads(content)
                 except json.JSONDecodeError:
                     # If that fails, try to fix common issues like trailing commas
-                    import re
-
-                    # Remove trailing commas before ] or }
-                    fixed_content = re.sub(r",\s*([}\]])", r"\1", content)
+                    fixed_content = _TRAILING_COMMA_RE.sub(rb"\1", content)
                     existing_settings = json.loads(fixed_content)
+                    fixed_formatting = True
                     print(
-                        f"⚠️  Fixed JSON formatting issues (trailing commas) in: {output_path}"
+                        f"⚠️  Fixed JSON formatting issues (trailing commas) in: {output_path}",
+                        file=out,
                     )
 
-                print(f"📖 Reading existing settings from: {output_path}")
+                print(f"📖 Reading existing settings from: {output_path}", file=out)
 
                 # Extract existing allow permissions
                 if (
@@ -134,7 +460,8 @@ def update_settings_file(output_path: Path, permissions: Set[str]) -> None:
                 ):
                     existing_allow = set(existing_settings["permissions"]["allow"])
                     print(
-                        f"  📋 Found {len(existing_allow)} existing allowed permissions"
+                        f"  📋 Found {len(existing_allow)} existing allowed permissions",
+                        file=out,
                     )
 
             except (json.JSONDecodeError, Exception) as e:
@@ -150,11 +477,28 @@ def update_settings_file(output_path: Path, permissions: Set[str]) -> None:
         if "permissions" not in existing_settings:
             existing_settings["permissions"] = {}
 
+        # Skip the rewrite when the file already holds exactly the merged result
+        new_permissions = permissions - existing_allow
+        existing_permissions = existing_settings["permissions"]
+        if (
+            not new_permissions
+            and not fixed_formatting
+            and "deny" in existing_permissions
+            and "ask" in existing_permissions
+            and existing_permissions.get("allow") == sorted(existing_allow)
+        ):
+            print(f"\n✔️  No new permissions to add (all already exist)", file=out)
+            print(f"✅ Settings already up to date in: {output_path}", file=out)
+            print(f"   Total unique permissions: {len(existing_allow)}", file=out)
+            return
+
         # Merge existing and new permissions, removing duplicates
-        merged_allow = existing_allow.union(permissions)
+        existing_allow.update(permissions)
+        merged_allow = existing_allow
 
         # Update the allow list with sorted permissions
-        existing_settings["permissions"]["allow"] = sorted(list(merged_allow))
+        allow_sorted = sorted(merged_allow)
+        existing_settings["permissions"]["allow"] = allow_sorted
 
         # Preserve deny and ask if they don't exist
         if "deny" not in existing_settings["permissions"]:
@@ -162,28 +506,38 @@ def update_settings_file(output_path: Path, permissions: Set[str]) -> None:
         if "ask" not in existing_settings["permissions"]:
             existing_settings["permissions"]["ask"] = []
 
-        # Write the updated settings
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(existing_settings, f, indent=2, ensure_ascii=False)
-            f.write("\n")  # Add newline at end of file
+        # Write the updated settings without ever leaving a truncated file behind
+        with _atomic_writer(output_path) as f:
+            _stream_settings(f, existing_settings, allow_sorted)
 
         # Report what was added
-        new_permissions = permissions - existing_allow
         if new_permissions:
-            print(f"\n🆕 Added {len(new_permissions)} new permissions")
+            print(f"\n🆕 Added {len(new_permissions)} new permissions", file=out)
         else:
-            print(f"\n✔️  No new permissions to add (all already exist)")
+            print(f"\n✔️  No new permissions to add (all already exist)", file=out)
 
-        print(f"✅ Successfully updated settings in: {output_path}")
-        print(f"   Total unique permissions: {len(merged_allow)}")
+        print(f"✅ Successfully updated settings in: {output_path}", file=out)
+        print(f"   Total unique permissions: {len(merged_allow)}", file=out)
 
     except Exception as e:
         print(f"❌ Error writing output file: {e}", file=sys.stderr)
         sys.exit(1)
 
 
-def main():
-    """Main function to run the merge process."""
+def _non_negative_int(value: str) -> int:
+    """Parse a command line value as an integer that is zero or greater."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be non-negative, got {number}")
+    return number
+
+
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser once and reuse it for every call to main()."""
     parser = argparse.ArgumentParser(
         description="Merge Claude settings.local.json files from multiple directories"
     )
@@ -199,18 +553,74 @@ def main():
         default="conf/.claude/settings.json",
         help="Output file path (default: conf/.claude/settings.json)",
     )
+    parser.add_argument(
+        "--max-depth",
+        type=_non_negative_int,
+        default=None,
+        metavar="N",
+        help="Maximum directory depth to search below DIRECTORY (default: unlimited)",
+    )
+    parser.add_argument(
+        "--scan-workers",
+        type=_non_negative_int,
+        default=0,
+        metavar="N",
+        help="Scan directories with N threads, which helps on network filesystems "
+        "(default: 0, scan sequentially)",
+    )
     parser.add_argument(
         "-v",
         "--verbose",
         action="store_true",
         help="Show verbose output including all found permissions",
     )
+    parser.add_argument(
+        "-q",
+        "--quiet",
+        action="store_true",
+        help="Suppress all output except errors",
+    )
 
-    args = parser.parse_args()
+    return parser
 
-    # Convert to Path objects
-    root_dir = Path(args.directory).resolve()
-    output_path = Path(args.output).resolve()
+
+@dataclass(slots=True)
+class Config:
+    """Resolved configuration for a single merge run."""
+
+    root_dir: Path
+    output_path: Path
+    max_depth: Optional[int] = None
+    scan_workers: int = 0
+    verbose: bool = False
+    quiet: bool = False
+
+    @classmethod
+    def from_args(cls, argv: Optional[List[str]] = None) -> "Config":
+        """
+        Parse command line arguments into a Config.
+
+        Args:
+            argv: Arguments to parse (defaults to sys.argv[1:])
+
+        Returns:
+            Config with resolved paths
+        """
+        args = _build_parser().parse_args(argv)
+        return cls(
+            root_dir=Path(args.directory).resolve(),
+            output_path=Path(args.output).resolve(),
+            max_depth=args.max_depth,
+            scan_workers=args.scan_workers,
+            verbose=args.verbose,
+            quiet=args.quiet,
+        )
+
+
+def _run(config: Config, out: TextIO) -> None:
+    """Run the merge process for a resolved configuration, reporting to out."""
+    root_dir = config.root_dir
+    output_path = config.output_path
 
     # Validate input directory
     if not root_dir.exists():
@@ -221,40 +631,57 @@ def main():
         print(f"❌ Error: '{root_dir}' is not a directory", file=sys.stderr)
         sys.exit(1)
 
-    print(f"🔍 Searching for .claude/settings.local.json files in: {root_dir}")
-    print("-" * 60)
+    print(
+        f"🔍 Searching for .claude/settings.local.json files in: {root_dir}", file=out
+    )
+    print("-" * 60, file=out)
 
     # Find all settings files
-    settings_files = find_settings_files(root_dir)
+    settings_files = find_settings_files(
+        root_dir, config.max_depth, config.scan_workers
+    )
 
     if not settings_files:
-        print("⚠️  No .claude/settings.local.json files found")
+        print("⚠️  No .claude/settings.local.json files found", file=out)
         sys.exit(0)
 
-    print(f"📁 Found {len(settings_files)} settings file(s):")
+    print(f"📁 Found {len(settings_files)} settings file(s):", file=out)
 
     # Merge permissions
-    merged_permissions = merge_permissions(settings_files, root_dir)
+    merged_permissions = merge_permissions(settings_files, root_dir, out)
 
     if not merged_permissions:
-        print("\n⚠️  No permissions found to merge")
+        print("\n⚠️  No permissions found to merge", file=out)
         sys.exit(0)
 
-    print(f"\n📊 Total unique permissions found: {len(merged_permissions)}")
+    print(f"\n📊 Total unique permissions found: {len(merged_permissions)}", file=out)
 
-    if args.verbose:
-        print("\n📋 Merged permissions list:")
-        for perm in sorted(merged_permissions):
-            print(f"  • {perm}")
+    if config.verbose:
+        print("\n📋 Merged permissions list:", file=out)
+        out.writelines(f"  • {perm}\n" for perm in sorted(merged_permissions))
 
     # Update the settings file with merged permissions
-    update_settings_file(output_path, merged_permissions)
+    update_settings_file(output_path, merged_permissions, out)
 
     # Print summary
-    print("\n📈 Summary:")
-    print(f"  • Files processed: {len(settings_files)}")
-    print(f"  • Unique permissions: {len(merged_permissions)}")
-    print(f"  • Output file: {output_path}")
+    print("\n📈 Summary:", file=out)
+    print(f"  • Files processed: {len(settings_files)}", file=out)
+    print(f"  • Unique permissions: {len(merged_permissions)}", file=out)
+    print(f"  • Output file: {output_path}", file=out)
+
+
+def main(argv: Optional[List[str]] = None):
+    """Main function to run the merge process."""
+    config = Config.from_args(argv)
+
+    if config.quiet:
+        # Discard informational output entirely; errors still go to stderr.
+        # The stream is passed down rather than rebinding the process-wide
+        # sys.stdout, which other threads of a library caller may be using.
+        with open(os.devnull, "w") as devnull:
+            _run(config, devnull)
+    else:
+        _run(config, sys.stdout)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,271 @@
+import io
+import json
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+import merge_claude_settings as mcs
+
+SETTINGS_CASES = [
+    pytest.param(
+        {"permissions": {"allow": ["Bash(ls:*)", "Read(**)"], "deny": [], "ask": []}},
+        id="minimal",
+    ),
+    pytest.param(
+        {"permissions": {"allow": [], "deny": [], "ask": []}},
+        id="empty-allow",
+    ),
+    pytest.param(
+        {
+            "model": "opus",
+            "statusLine": {"type": "command", "padding": 0, "nested": {"a": [1, {}]}},
+            "env": {},
+            "flags": [True, False, None, 1.5],
+            "permissions": {
+                "deny": ["Bash(rm:*)"],
+                "allow": ["Bash(git:*)", "WebSearch"],
+                "additionalDirectories": [],
+                "defaultMode": "plan",
+                "ask": [],
+            },
+        },
+        id="nested",
+    ),
+    pytest.param(
+        {
+            "greeting": "héllo wörld ✨",
+            "permissions": {"allow": ["Bash(echo 'ünï':*)", 'q"uote'], "ask": []},
+        },
+        id="non-ascii",
+    ),
+    pytest.param(
+        {"permissions": {"allow": [f"Bash(cmd{i}:*)" for i in range(10)], "ask": []}},
+        id="several-slices",
+    ),
+    pytest.param(
+        {
+            "x": float("nan"),
+            "y": float("inf"),
+            "z": [float("-inf"), 1.5e20, 2**70],
+            "permissions": {"allow": ["Bash(ls:*)"], "limits": {"max": float("inf")}},
+        },
+        id="non-finite-and-large-numbers",
+    ),
+]
+
+BACKENDS = [
+    pytest.param(
+        True,
+        id="orjson",
+        marks=pytest.mark.skipif(mcs.orjson is None, reason="orjson not installed"),
+    ),
+    pytest.param(False, id="stdlib"),
+]
+
+
+@pytest.mark.parametrize("use_orjson", BACKENDS)
+@pytest.mark.parametrize("settings", SETTINGS_CASES)
+def test_stream_settings_matches_stdlib_dump(settings, use_orjson, monkeypatch):
+    if not use_orjson:
+        monkeypatch.setattr(mcs, "orjson", None)
+    # Small slices so that multi-entry allow lists span several of them
+    monkeypatch.setattr(mcs, "_ALLOW_SLICE_SIZE", 3)
+
+    f = io.BytesIO()
+    mcs._stream_settings(f, settings, settings["permissions"]["allow"])
+
+    # The written-back file must match what the stdlib json module produces
+    expected = json.dumps(settings, indent=2, ensure_ascii=False) + "\n"
+    assert f.getvalue() == expected.encode("utf-8")
+
+
+def make_settings_tree(root: Path, *dirs: str) -> None:
+    """Create .claude/settings.local.json under each directory relative to root."""
+    for directory in dirs:
+        claude_dir = root / directory / ".claude"
+        claude_dir.mkdir(parents=True)
+        (claude_dir / "settings.local.json").write_text(
+            '{"permissions": {"allow": ["Bash(ls:*)"]}}'
+        )
+
+
+def found_dirs(root: Path, settings_files) -> list:
+    """Return the project directories of found settings files, relative to root."""
+    return [path.parent.parent.relative_to(root).as_posix() for path in settings_files]
+
+
+@pytest.mark.parametrize("max_depth", [None, 0, 1, 2])
+def test_concurrent_scan_matches_sequential(tmp_path, max_depth):
+    make_settings_tree(tmp_path, ".", "a", "a/b", "a/b/c", "d", "d/e/f/g")
+    (tmp_path / "empty" / "deeper").mkdir(parents=True)
+
+    sequential = mcs.find_settings_files(tmp_path, max_depth)
+    concurrent = mcs.find_settings_files(tmp_path, max_depth, scan_workers=4)
+
+    assert concurrent == sequential
+    if max_depth is None:
+        assert found_dirs(tmp_path, concurrent) == [
+            ".",
+            "a",
+            "a/b",
+            "a/b/c",
+            "d",
+            "d/e/f/g",
+        ]
+
+
+def test_update_settings_file_skips_rewrite_when_up_to_date(tmp_path):
+    output = tmp_path / "settings.json"
+    mcs.update_settings_file(output, {"Bash(ls:*)", "Read(**)"})
+    before = output.stat()
+    content = output.read_bytes()
+
+    mcs.update_settings_file(output, {"Read(**)"})
+
+    after = output.stat()
+    assert (after.st_ino, after.st_mtime_ns) == (before.st_ino, before.st_mtime_ns)
+    assert output.read_bytes() == content
+
+
+@pytest.mark.parametrize(
+    "existing",
+    [
+        pytest.param(
+            '{"permissions": {"allow": ["Read(**)",], "deny": [], "ask": []}}',
+            id="trailing-comma",
+        ),
+        pytest.param('{"permissions": {"allow": ["Read(**)"]}}', id="no-deny-ask"),
+    ],
+)
+def test_update_settings_file_rewrites_when_needed(tmp_path, existing):
+    output = tmp_path / "settings.json"
+    output.write_text(existing)
+    inode = output.stat().st_ino
+
+    mcs.update_settings_file(output, {"Read(**)"})
+
+    assert output.stat().st_ino != inode
+    assert json.loads(output.read_text()) == {
+        "permissions": {"allow": ["Read(**)"], "deny": [], "ask": []}
+    }
+
+
+def test_atomic_writer_keeps_mode_of_replaced_file(tmp_path):
+    target = tmp_path / "settings.json"
+    target.write_bytes(b"old")
+    target.chmod(0o640)
+
+    with mcs._atomic_writer(target) as f:
+        f.write(b"new")
+
+    assert target.read_bytes() == b"new"
+    assert stat.S_IMODE(target.stat().st_mode) == 0o640
+    assert [path.name for path in tmp_path.iterdir()] == ["settings.json"]
+
+
+def test_atomic_writer_creates_new_file_with_umask_mode(tmp_path):
+    target = tmp_path / "settings.json"
+    umask = os.umask(0o027)
+    try:
+        with mcs._atomic_writer(target) as f:
+            f.write(b"new")
+    finally:
+        os.umask(umask)
+
+    assert stat.S_IMODE(target.stat().st_mode) == 0o640
+
+
+def test_atomic_writer_removes_temp_file_on_error(tmp_path):
+    target = tmp_path / "settings.json"
+    target.write_bytes(b"old")
+
+    with pytest.raises(RuntimeError):
+        with mcs._atomic_writer(target) as f:
+            f.write(b"partial")
+            raise RuntimeError("boom")
+
+    assert target.read_bytes() == b"old"
+    assert [path.name for path in tmp_path.iterdir()] == ["settings.json"]
+
+
+def test_merge_permissions_reports_warnings_in_file_order(tmp_path, monkeypatch):
+    make_settings_tree(tmp_path, "a", "b", "c")
+    (tmp_path / "b" / ".claude" / "settings.local.json").write_text("[1, 2]")
+    settings_files = mcs.find_settings_files(tmp_path)
+
+    # Capture stdout and stderr together to check how they interleave
+    output = io.StringIO()
+    monkeypatch.setattr(mcs.sys, "stdout", output)
+    monkeypatch.setattr(mcs.sys, "stderr", output)
+    permissions = mcs.merge_permissions(settings_files, tmp_path)
+
+    assert permissions == {"Bash(ls:*)"}
+    assert output.getvalue().splitlines() == [
+        "  📄 Found 1 permissions in: a/.claude/settings.local.json",
+        f"⚠️  Error reading {tmp_path / 'b/.claude/settings.local.json'}: "
+        "list indices must be integers or slices, not str",
+        "  📄 Found 1 permissions in: c/.claude/settings.local.json",
+    ]
+
+
+@pytest.mark.parametrize("excluded", sorted(mcs._EXCLUDE_DIRS))
+def test_find_settings_files_skips_excluded_dirs(tmp_path, excluded):
+    make_settings_tree(tmp_path, "project", f"{excluded}/pkg", f"project/{excluded}")
+
+    settings_files = mcs.find_settings_files(tmp_path)
+
+    assert found_dirs(tmp_path, settings_files) == ["project"]
+
+
+def test_find_settings_files_does_not_descend_into_claude_dir(tmp_path):
+    make_settings_tree(tmp_path, "project", "project/.claude/nested")
+
+    settings_files = mcs.find_settings_files(tmp_path)
+
+    assert found_dirs(tmp_path, settings_files) == ["project"]
+
+
+@pytest.mark.parametrize(
+    "max_depth, expected",
+    [
+        (0, ["."]),
+        (1, [".", "x"]),
+        (2, [".", "x", "x/y"]),
+        (None, [".", "x", "x/y", "x/y/z"]),
+    ],
+)
+def test_find_settings_files_max_depth(tmp_path, max_depth, expected):
+    make_settings_tree(tmp_path, ".", "x", "x/y", "x/y/z")
+
+    settings_files = mcs.find_settings_files(tmp_path, max_depth)
+
+    assert found_dirs(tmp_path, settings_files) == expected
+
+
+def test_max_depth_rejects_negative_values(capsys):
+    with pytest.raises(SystemExit) as excinfo:
+        mcs.Config.from_args(["--max-depth", "-1"])
+
+    assert excinfo.value.code == 2
+    assert "must be non-negative" in capsys.readouterr().err
+
+
+def test_quiet_run_leaves_sys_stdout_alone(tmp_path, monkeypatch, capsys):
+    make_settings_tree(tmp_path, "project")
+    output = tmp_path / "settings.json"
+    find_settings_files = mcs.find_settings_files
+    stdout_seen = []
+
+    def spy(*args, **kwargs):
+        stdout_seen.append(mcs.sys.stdout)
+        return find_settings_files(*args, **kwargs)
+
+    monkeypatch.setattr(mcs, "find_settings_files", spy)
+    stdout = mcs.sys.stdout
+    mcs.main([str(tmp_path), "-o", str(output), "-q"])
+
+    assert stdout_seen == [stdout]
+    assert capsys.readouterr().out == ""
+    assert json.loads(output.read_text())["permissions"]["allow"] == ["Bash(ls:*)"]